@@ -0,0 +1,38 @@
+"""Shared fixtures for the test suite."""
+
+import os
+
+# Select a headless matplotlib backend before anything imports pyplot.
+# Using the environment variable avoids importing matplotlib during
+# collection just to call matplotlib.use().
+os.environ.setdefault("MPLBACKEND", "Agg")
+
+import pytest
+
+from virtuallife.config.loader import get_default_config
+
+
+@pytest.fixture(scope="session")
+def default_config_template():
+    """Fixture that loads the default configuration once per session.
+
+    Building the default SimulationConfig runs a full Pydantic validation
+    pass over seven nested models, so tests share one template instead of
+    rebuilding it. Tests that mutate the config must take a copy via
+    ``model_copy(deep=True)``; read-only tests can use it directly.
+    """
+    return get_default_config()
+
+
+@pytest.fixture(scope="session")
+def runner():
+    """Fixture that returns a CLI runner shared across the session.
+
+    CliRunner is stateless between invoke() calls, so one instance can be
+    reused by every CLI test instead of rebuilding it per test. The import
+    lives here so a missing typer skips only the tests that request the
+    fixture instead of killing collection of the whole suite.
+    """
+    from typer.testing import CliRunner
+
+    return CliRunner()
@@ -9,19 +9,15 @@ import tempfile
 from pathlib import Path
 
 import pytest
-from typer.testing import CliRunner
+
+pytest.importorskip("typer.testing", reason="CLI tests need typer's test runner")
 
 from virtuallife.cli import app
 from virtuallife.config.loader import load_config, save_config
 from virtuallife.config.models import SimulationConfig
 
 
-@pytest.fixture
-def runner():
-    """Fixture that returns a CLI runner."""
-    return CliRunner()
-
-
+@pytest.mark.slow
 def test_create_and_run_with_config(runner):
     """Test creating a configuration file and then running a simulation with it."""
     # Arrange
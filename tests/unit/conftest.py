@@ -0,0 +1,17 @@
+"""Shared fixtures for the unit tests."""
+
+import time
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _no_sleep(request, monkeypatch):
+    """No-op time.sleep for unit tests so delay-bound paths run instantly.
+
+    Tests that genuinely measure timing opt back in with the real_sleep
+    marker.
+    """
+    if request.node.get_closest_marker("real_sleep"):
+        return
+    monkeypatch.setattr(time, "sleep", lambda *_: None)
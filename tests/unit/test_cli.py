@@ -4,62 +4,61 @@ This module contains tests for the CLI functionality.
 """
 
 import os
-import tempfile
-from pathlib import Path
 from unittest.mock import patch, MagicMock
 
 import pytest
-from typer.testing import CliRunner
 
-from virtuallife.cli import app
+pytest.importorskip("typer.testing", reason="CLI tests need typer's test runner")
+
+from virtuallife.cli import app, setup_simulation, _norm_boundary
+from virtuallife.config.loader import load_config, save_config
 from virtuallife.config.models import SimulationConfig
 
 
 @pytest.fixture
-def runner():
-    """Fixture that returns a CLI runner."""
-    return CliRunner()
+def mock_setup_simulation(monkeypatch):
+    """Fixture that mocks the setup_simulation function."""
+    # Return a mock runner and visualizer from the mocked setup function
+    mock = MagicMock(return_value=(MagicMock(), MagicMock()))
+    monkeypatch.setattr("virtuallife.cli.setup_simulation", mock)
+    return mock
 
 
-@pytest.fixture
-def mock_setup_simulation():
-    """Fixture that mocks the setup_simulation function."""
-    with patch("virtuallife.cli.setup_simulation") as mock:
-        # Create a mock runner
-        mock_runner = MagicMock()
-        mock_visualizer = MagicMock()
-        
-        # Configure the mock to return our mock runner and visualizer
-        mock.return_value = (mock_runner, mock_visualizer)
-        
-        yield mock
+@pytest.fixture(scope="session")
+def _default_config_yaml_bytes(tmp_path_factory):
+    """Serialize the default configuration to YAML once per session."""
+    path = tmp_path_factory.mktemp("config") / "default.yaml"
+    save_config(SimulationConfig(), path)
+    return path.read_bytes()
 
 
 @pytest.fixture
-def temp_config_file():
+def temp_config_file(tmp_path, _default_config_yaml_bytes):
     """Fixture that creates a temporary configuration file."""
-    config = SimulationConfig()
-    with tempfile.NamedTemporaryFile(suffix=".yaml", delete=False) as tmp:
-        from virtuallife.config.loader import save_config
-        save_config(config, tmp.name)
-        yield Path(tmp.name)
-    # Clean up
-    if os.path.exists(tmp.name):
-        os.unlink(tmp.name)
-
-
-def test_run_simulation_with_defaults(runner, mock_setup_simulation):
-    """Test running a simulation with default settings."""
+    config_path = tmp_path / "config.yaml"
+    config_path.write_bytes(_default_config_yaml_bytes)
+    return config_path
+
+
+@pytest.mark.parametrize("extra_args,expected_vis,steps", [
+    ([], None, 5),
+    (["--visualizer", "matplotlib"], "matplotlib", 3),
+    (["--no-vis"], "none", 3),
+])
+def test_run_simulation(runner, mock_setup_simulation, extra_args, expected_vis, steps):
+    """Test running a simulation with various visualization settings."""
     # Arrange
     mock_runner, mock_visualizer = mock_setup_simulation.return_value
-    
+
     # Act
-    result = runner.invoke(app, ["run", "--steps", "5"])
-    
+    result = runner.invoke(app, ["run", *extra_args, "--steps", str(steps)])
+
     # Assert
     assert result.exit_code == 0
     mock_setup_simulation.assert_called_once()
-    mock_runner.run.assert_called_once_with(5)
+    if expected_vis is not None:
+        assert mock_setup_simulation.call_args[0][1] == expected_vis
+    mock_runner.run.assert_called_once_with(steps)
 
 
 def test_run_simulation_with_config(runner, mock_setup_simulation, temp_config_file):
@@ -76,36 +75,6 @@ def test_run_simulation_with_config(runner, mock_setup_simulation, temp_config_f
     mock_runner.run.assert_called_once_with(10)
 
 
-def test_run_simulation_with_matplotlib(runner, mock_setup_simulation):
-    """Test running a simulation with matplotlib visualization."""
-    # Arrange
-    mock_runner, mock_visualizer = mock_setup_simulation.return_value
-    
-    # Act
-    result = runner.invoke(app, ["run", "--visualizer", "matplotlib", "--steps", "3"])
-    
-    # Assert
-    assert result.exit_code == 0
-    mock_setup_simulation.assert_called_once()
-    assert mock_setup_simulation.call_args[0][1] == "matplotlib"
-    mock_runner.run.assert_called_once_with(3)
-
-
-def test_run_simulation_no_visualization(runner, mock_setup_simulation):
-    """Test running a simulation with no visualization."""
-    # Arrange
-    mock_runner, mock_visualizer = mock_setup_simulation.return_value
-    
-    # Act
-    result = runner.invoke(app, ["run", "--no-vis", "--steps", "3"])
-    
-    # Assert
-    assert result.exit_code == 0
-    mock_setup_simulation.assert_called_once()
-    assert mock_setup_simulation.call_args[0][1] == "none"
-    mock_runner.run.assert_called_once_with(3)
-
-
 def test_run_simulation_with_invalid_visualizer(runner):
     """Test running a simulation with an invalid visualizer."""
     # Act
@@ -147,34 +116,30 @@ def test_run_simulation_general_exception(runner, mock_setup_simulation):
         mock_exception.assert_called_once()
 
 
-def test_show_info_with_defaults(runner):
-    """Test displaying information about default configuration."""
-    # Act
-    result = runner.invoke(app, ["info"])
-    
-    # Assert
-    assert result.exit_code == 0
-    assert "Configuration Details" in result.stdout
-    assert "Environment" in result.stdout
-    assert "Energy" in result.stdout
-    assert "Movement" in result.stdout
-    assert "Reproduction" in result.stdout
-    assert "Resources" in result.stdout
+# Sections expected in the output of the "info" command
+_INFO_SECTIONS = (
+    "Configuration Details",
+    "Environment",
+    "Energy",
+    "Movement",
+    "Reproduction",
+    "Resources",
+)
 
 
-def test_show_info_with_config(runner, temp_config_file):
-    """Test displaying information about a configuration file."""
+@pytest.mark.parametrize("use_config", [False, True], ids=["defaults", "with-config"])
+def test_show_info(runner, temp_config_file, use_config):
+    """Test displaying configuration information with and without a file."""
+    # Arrange
+    args = ["info", "--config", str(temp_config_file)] if use_config else ["info"]
+
     # Act
-    result = runner.invoke(app, ["info", "--config", str(temp_config_file)])
-    
+    result = runner.invoke(app, args)
+
     # Assert
     assert result.exit_code == 0
-    assert "Configuration Details" in result.stdout
-    assert "Environment" in result.stdout
-    assert "Energy" in result.stdout
-    assert "Movement" in result.stdout
-    assert "Reproduction" in result.stdout
-    assert "Resources" in result.stdout
+    missing = [section for section in _INFO_SECTIONS if section not in result.stdout]
+    assert not missing, f"Missing sections in info output: {missing}"
 
 
 def test_show_info_with_exception(runner):
@@ -190,86 +155,53 @@ def test_show_info_with_exception(runner):
             mock_exception.assert_called_once()
 
 
-def test_create_config(runner):
+def test_create_config(runner, tmp_path):
     """Test creating a configuration file."""
     # Arrange
-    with tempfile.NamedTemporaryFile(suffix=".yaml", delete=False) as tmp:
-        output_path = tmp.name
-    
-    # Clean up before test (in case it exists)
-    if os.path.exists(output_path):
-        os.unlink(output_path)
-    
-    try:
-        # Act
-        result = runner.invoke(
-            app, 
-            [
-                "create-config", 
-                output_path, 
-                "--width", "200", 
-                "--height", "200", 
-                "--boundary", "bounded",
-                "--entities", "20",
-                "--seed", "42"
-            ]
-        )
-        
-        # Assert
-        assert result.exit_code == 0
-        assert os.path.exists(output_path)
-        
-        # Verify the contents of the config file
-        from virtuallife.config.loader import load_config
-        config = load_config(output_path)
-        assert config.environment.width == 200
-        assert config.environment.height == 200
-        assert config.environment.boundary_condition == "bounded"
-        assert config.environment.initial_entities == 20
-        assert config.random_seed == 42
-        
-    finally:
-        # Clean up
-        if os.path.exists(output_path):
-            os.unlink(output_path)
+    output_path = str(tmp_path / "out.yaml")
 
+    # Act
+    result = runner.invoke(
+        app,
+        [
+            "create-config",
+            output_path,
+            "--width", "200",
+            "--height", "200",
+            "--boundary", "bounded",
+            "--entities", "20",
+            "--seed", "42"
+        ]
+    )
 
-def test_create_config_with_invalid_boundary(runner):
-    """Test creating a configuration file with an invalid boundary condition."""
-    # Arrange
-    with tempfile.NamedTemporaryFile(suffix=".yaml", delete=False) as tmp:
-        output_path = tmp.name
-    
-    # Clean up before test (in case it exists)
-    if os.path.exists(output_path):
-        os.unlink(output_path)
-    
-    try:
-        # Act
-        with patch('logging.Logger.warning') as mock_warning:
-            result = runner.invoke(
-                app, 
-                [
-                    "create-config", 
-                    output_path, 
-                    "--boundary", "invalid"
-                ],
-                catch_exceptions=False
-            )
-        
-        # Assert
-        assert result.exit_code == 0
-        mock_warning.assert_called_once_with("Invalid boundary condition 'invalid', using 'wrapped'")
-        
-        # Verify the contents of the config file
-        from virtuallife.config.loader import load_config
-        config = load_config(output_path)
-        assert config.environment.boundary_condition == "wrapped"
-        
-    finally:
-        # Clean up
-        if os.path.exists(output_path):
-            os.unlink(output_path)
+    # Assert
+    assert result.exit_code == 0
+    assert os.path.exists(output_path)
+
+    # Verify the contents of the config file
+    config = load_config(output_path)
+    assert config.environment.width == 200
+    assert config.environment.height == 200
+    assert config.environment.boundary_condition == "bounded"
+    assert config.environment.initial_entities == 20
+    assert config.random_seed == 42
+
+
+@pytest.mark.parametrize("raw,expected", [
+    pytest.param("wrapped", "wrapped", id="wrapped"),
+    pytest.param("Bounded", "bounded", id="case-insensitive"),
+])
+def test_norm_boundary_valid(raw, expected):
+    """Test that known boundary conditions are normalized to lowercase."""
+    assert _norm_boundary(raw) == expected
+
+
+def test_norm_boundary_invalid():
+    """Test that unknown boundary conditions fall back to 'wrapped' with a warning."""
+    with patch('logging.Logger.warning') as mock_warning:
+        assert _norm_boundary("invalid") == "wrapped"
+
+    mock_warning.assert_called_once_with("Invalid boundary condition 'invalid', using 'wrapped'")
 
 
 def test_create_config_with_exception(runner):
@@ -290,9 +222,6 @@ def test_create_config_with_exception(runner):
 
 def test_setup_simulation():
     """Test the setup_simulation function directly."""
-    # Import the function to test it directly
-    from virtuallife.cli import setup_simulation
-    
     # Create a configuration
     config = SimulationConfig()
     
@@ -318,9 +247,6 @@ def test_setup_simulation():
 
 def test_setup_simulation_with_random_seed():
     """Test the setup_simulation function with a random seed."""
-    # Import the function to test it directly
-    from virtuallife.cli import setup_simulation
-    
     # Create a configuration with a random seed
     config = SimulationConfig(random_seed=42)
     
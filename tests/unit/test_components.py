@@ -1,6 +1,10 @@
-"""Unit tests for the standard components."""
+"""Unit tests for the standard components.
+
+PYTEST_DONT_REWRITE: the assertions in this module are simple equality
+checks, so pytest's assertion-rewrite pass is skipped to keep the module's
+bytecode small and its import fast.
+"""
 
-from unittest.mock import MagicMock, patch
 import pytest
 
 from virtuallife.config.models import (
@@ -19,111 +23,189 @@ from virtuallife.simulation.entity import Entity
 from virtuallife.simulation.environment import Environment
 
 
-@pytest.fixture
-def environment():
-    """Create a test environment."""
+# Common component configurations, built once; components never mutate them.
+DECAY_CONFIG = EnergyConfig(initial_energy=100.0, decay_rate=10.0)
+LOW_ENERGY_CONFIG = EnergyConfig(initial_energy=5.0, decay_rate=10.0)
+DEATH_THRESHOLD_CONFIG = EnergyConfig(
+    initial_energy=100.0, decay_rate=10.0, death_threshold=50.0
+)
+COSTLY_MOVEMENT_CONFIG = MovementConfig(speed=1.0, movement_cost=10.0)
+FAST_MOVEMENT_CONFIG = MovementConfig(speed=2.0, movement_cost=1.0)
+SPEED_2_CONFIG = MovementConfig(speed=2.0)
+
+
+@pytest.fixture(scope="module")
+def _env_template():
+    """Single Environment instance shared by every test in this module."""
     return Environment(10, 10)
 
 
+@pytest.fixture
+def environment(_env_template):
+    """Create a test environment, reset between tests."""
+    _env_template.reset()
+    return _env_template
+
+
 @pytest.fixture
 def entity():
     """Create a test entity."""
     return Entity(position=(5, 5))
 
 
-def test_energy_component_initialization():
-    """Test energy component initialization."""
+@pytest.fixture
+def bare_entity():
+    """Create a bare entity without components."""
+    return Entity()
+
+
+class StubEnv:
+    """Minimal environment stand-in that records the calls components make.
+
+    Far cheaper to construct than a MagicMock for tests that only need to
+    inspect which entities were added, moved or removed.
+    """
+
+    def __init__(self):
+        self.added = []
+        self.removed = []
+        self.moved = []
+        self.consume_calls = []
+        self.consume_resource_return = 0.0
+
+    def add_entity(self, entity):
+        self.added.append(entity)
+
+    def remove_entity(self, entity):
+        self.removed.append(entity)
+
+    def move_entity(self, entity, new_position):
+        self.moved.append((entity, new_position))
+
+    def consume_resource(self, position, resource_type, amount):
+        self.consume_calls.append((position, resource_type, amount))
+        return self.consume_resource_return
+
+
+@pytest.fixture
+def stub_env():
+    """Create a stub environment."""
+    return StubEnv()
+
+
+@pytest.mark.parametrize("component_cls,config_cls,default_attrs,override_kwargs,override_attrs", [
+    pytest.param(
+        EnergyComponent, EnergyConfig,
+        {"energy": 100.0, "max_energy": 100.0, "decay_rate": 0.1,
+         "death_threshold": 0.0},
+        {"initial_energy": 200.0, "max_energy": 300.0, "decay_rate": 0.2,
+         "death_threshold": 10.0},
+        {"energy": 200.0, "max_energy": 300.0, "decay_rate": 0.2,
+         "death_threshold": 10.0},
+        id="energy",
+    ),
+    pytest.param(
+        MovementComponent, MovementConfig,
+        {"speed": 1.0, "movement_cost": 0.1},
+        {"speed": 2.0, "movement_cost": 0.2},
+        {"speed": 2.0, "movement_cost": 0.2},
+        id="movement",
+    ),
+    pytest.param(
+        ResourceConsumerComponent, ConsumerConfig,
+        {"resource_type": "food", "consumption_rate": 1.0,
+         "energy_conversion": 0.5},
+        {"resource_type": "plants", "consumption_rate": 2.0,
+         "energy_conversion": 0.8},
+        {"resource_type": "plants", "consumption_rate": 2.0,
+         "energy_conversion": 0.8},
+        id="consumer",
+    ),
+    pytest.param(
+        ReproductionComponent, ReproductionConfig,
+        {"reproduction_threshold": 80.0, "reproduction_cost": 50.0,
+         "reproduction_chance": 0.1, "offspring_energy": 50.0,
+         "mutation_rate": 0.1,
+         "inherit_components": {
+             "energy": True,
+             "movement": True,
+             "consumer": True,
+             "reproduction": True,
+         }},
+        {"reproduction_threshold": 100.0, "reproduction_cost": 60.0,
+         "reproduction_chance": 0.2, "offspring_energy": 40.0,
+         "mutation_rate": 0.2,
+         "inherit_components": {"energy": True, "movement": False}},
+        {"reproduction_threshold": 100.0, "reproduction_cost": 60.0,
+         "reproduction_chance": 0.2, "offspring_energy": 40.0,
+         "mutation_rate": 0.2,
+         "inherit_components": {"energy": True, "movement": False}},
+        id="reproduction",
+    ),
+])
+def test_component_initialization(component_cls, config_cls, default_attrs,
+                                  override_kwargs, override_attrs):
+    """Test component initialization with default and custom configs."""
     # Test with default config
-    component = EnergyComponent()
-    assert component.energy == 100.0
-    assert component.max_energy == 100.0
-    assert component.decay_rate == 0.1
-    assert component.death_threshold == 0.0
-    
+    component = component_cls()
+    for attr, expected in default_attrs.items():
+        assert getattr(component, attr) == expected
+
     # Test with custom config
-    config = EnergyConfig(
-        initial_energy=200.0,
-        max_energy=300.0,
-        decay_rate=0.2,
-        death_threshold=10.0
-    )
-    component = EnergyComponent(config=config)
-    assert component.energy == 200.0
-    assert component.max_energy == 300.0
-    assert component.decay_rate == 0.2
-    assert component.death_threshold == 10.0
-    
-    # Test with custom initial energy
+    component = component_cls(config=config_cls(**override_kwargs))
+    for attr, expected in override_attrs.items():
+        assert getattr(component, attr) == expected
+
+
+def test_energy_component_custom_initial_energy():
+    """Test that an explicit energy level overrides the config default."""
+    config = EnergyConfig(initial_energy=200.0)
     component = EnergyComponent(config=config, energy=150.0)
     assert component.energy == 150.0
 
 
-def test_energy_component_decay():
+def test_energy_component_decay(bare_entity, stub_env):
     """Test energy decay over time."""
-    config = EnergyConfig(initial_energy=100.0, decay_rate=10.0)
-    component = EnergyComponent(config=config)
-    entity = Entity()
-    env = MagicMock()
-    
-    component.update(entity, env)
-    assert component.energy == 90.0  # 100 - 10
-    
-    component.update(entity, env)
-    assert component.energy == 80.0  # 90 - 10
+    component = EnergyComponent(config=DECAY_CONFIG)
+
+    energies = [
+        (component.update(bare_entity, stub_env), component.energy)[1]
+        for _ in range(2)
+    ]
+    assert energies == pytest.approx([90.0, 80.0])  # 10.0 decay per update
 
 
-def test_energy_never_negative():
+def test_energy_never_negative(bare_entity, stub_env):
     """Test that energy never goes below zero."""
-    config = EnergyConfig(initial_energy=5.0, decay_rate=10.0)
-    component = EnergyComponent(config=config)
-    entity = Entity()
-    env = MagicMock()
-    
-    component.update(entity, env)
+    component = EnergyComponent(config=LOW_ENERGY_CONFIG)
+
+    component.update(bare_entity, stub_env)
     assert component.energy == 0.0
 
 
-def test_energy_custom_death_threshold():
+@pytest.mark.parametrize("n_updates,should_die", [
+    (5, False),  # 100 -> 50, at the threshold
+    (6, True),   # 50 -> 40, below the threshold
+])
+def test_energy_custom_death_threshold(bare_entity, stub_env, n_updates, should_die):
     """Test custom death threshold."""
-    config = EnergyConfig(initial_energy=100.0, decay_rate=10.0, death_threshold=50.0)
-    component = EnergyComponent(config=config)
-    entity = Entity()
-    env = MagicMock()
-    
-    # First update: 100 -> 90 (above threshold)
-    component.update(entity, env)
-    env.remove_entity.assert_not_called()
-    
-    # Second update: 90 -> 80 (above threshold)
-    component.update(entity, env)
-    env.remove_entity.assert_not_called()
-    
-    # Third update: 80 -> 70 (above threshold)
-    component.update(entity, env)
-    env.remove_entity.assert_not_called()
-    
-    # Fourth update: 70 -> 60 (above threshold)
-    component.update(entity, env)
-    env.remove_entity.assert_not_called()
-    
-    # Fifth update: 60 -> 50 (at threshold)
-    component.update(entity, env)
-    env.remove_entity.assert_not_called()
-    
-    # Sixth update: 50 -> 40 (below threshold)
-    component.update(entity, env)
-    env.remove_entity.assert_called_once_with(entity)
+    component = EnergyComponent(config=DEATH_THRESHOLD_CONFIG)
+
+    for _ in range(n_updates):
+        component.update(bare_entity, stub_env)
 
+    if should_die:
+        assert stub_env.removed == [bare_entity]
+    else:
+        assert stub_env.removed == []
 
-def test_energy_component_death():
+
+def test_energy_component_death(bare_entity, stub_env):
     """Test that entity dies when energy depleted."""
-    config = EnergyConfig(initial_energy=5.0, decay_rate=10.0)
-    component = EnergyComponent(config=config)
-    entity = Entity()
-    env = MagicMock()
-    
-    component.update(entity, env)
-    env.remove_entity.assert_called_once_with(entity)
+    component = EnergyComponent(config=LOW_ENERGY_CONFIG)
+
+    component.update(bare_entity, stub_env)
+    assert stub_env.removed == [bare_entity]
 
 
 def test_energy_consumption():
@@ -153,25 +235,10 @@ def test_energy_addition():
     assert component.energy == 100.0
 
 
-def test_movement_component_initialization():
-    """Test movement component initialization."""
-    # Test with default config
-    component = MovementComponent()
-    assert component.speed == 1.0
-    assert component.movement_cost == 0.1
-    
-    # Test with custom config
-    config = MovementConfig(speed=2.0, movement_cost=0.2)
-    component = MovementComponent(config=config)
-    assert component.speed == 2.0
-    assert component.movement_cost == 0.2
-
-
 def test_movement_with_energy(environment, entity):
     """Test movement with energy consumption."""
     energy = EnergyComponent(energy=100.0)
-    config = MovementConfig(speed=1.0, movement_cost=10.0)
-    movement = MovementComponent(config=config)
+    movement = MovementComponent(config=COSTLY_MOVEMENT_CONFIG)
     
     entity.add_component("energy", energy)
     entity.add_component("movement", movement)
@@ -186,41 +253,46 @@ def test_movement_with_energy(environment, entity):
     assert energy.energy == 90.0  # 100 - (1.0 * 10.0)
 
 
-def test_movement_cost_scaling():
+def test_movement_cost_scaling(environment, entity):
     """Test that movement cost scales correctly with speed."""
     energy = EnergyComponent(energy=100.0)
-    config = MovementConfig(speed=2.0, movement_cost=1.0)
-    movement = MovementComponent(config=config)
-    
-    entity = Entity()
+    movement = MovementComponent(config=FAST_MOVEMENT_CONFIG)
+
     entity.add_component("energy", energy)
     entity.add_component("movement", movement)
-    
-    env = Environment(10, 10)
-    env.add_entity(entity)
-    
-    movement.update(entity, env)
+    environment.add_entity(entity)
+
+    movement.update(entity, environment)
     assert energy.energy == 98.0  # 100 - (2.0 * 1.0)
 
 
-def test_movement_boundary_conditions():
+@pytest.fixture(params=["wrapped", "bounded"])
+def env_boundary(request):
+    """Environment and its boundary condition, one per condition."""
+    return Environment(10, 10, boundary_condition=request.param), request.param
+
+
+def test_movement_boundary_conditions(monkeypatch, env_boundary):
     """Test movement with different boundary conditions."""
-    # Test wrapped boundaries
-    env_wrapped = Environment(10, 10, boundary_condition="wrapped")
+    env, boundary = env_boundary
     entity = Entity(position=(9, 9))
-    config = MovementConfig(speed=2.0)  # Higher speed to ensure boundary crossing
-    movement = MovementComponent(config=config)
+    # Higher speed to ensure boundary crossing
+    movement = MovementComponent(config=SPEED_2_CONFIG)
     energy = EnergyComponent(energy=100.0)
-    
+
     entity.add_component("energy", energy)
     entity.add_component("movement", movement)
-    env_wrapped.add_entity(entity)
-    
-    # Force movement in positive direction
-    with patch('random.uniform', return_value=1.5):
-        movement.update(entity, env_wrapped)
-        x, y = entity.position
-        assert 0 <= x < 10 and 0 <= y < 10  # Should wrap around
+    env.add_entity(entity)
+
+    # Force movement in positive direction, scoped to the components module
+    monkeypatch.setattr(
+        "virtuallife.simulation.components.random.randint", lambda a, b: 1
+    )
+    movement.update(entity, env)
+    if boundary == "wrapped":
+        assert entity.position == (0, 0)  # Wraps around from (9, 9)
+    else:
+        assert entity.position == (9, 9)  # Clamped at the boundary
 
 
 def test_movement_without_energy(environment, entity):
@@ -237,256 +309,131 @@ def test_movement_without_energy(environment, entity):
     assert entity.position == old_position
 
 
-def test_movement_with_depleted_energy():
+def test_movement_with_depleted_energy(bare_entity, stub_env):
     """Test movement when energy is depleted."""
     movement = MovementComponent()
-    energy = EnergyComponent(energy=0.0)
-    entity = Entity()
-    env = MagicMock()
-    
-    movement.update(entity, env)
-    env.move_entity.assert_not_called()
+    bare_entity.add_component("energy", EnergyComponent(energy=0.0))
 
+    movement.update(bare_entity, stub_env)
+    assert stub_env.moved == []
 
-def test_resource_consumer_initialization():
-    """Test resource consumer initialization."""
-    # Test with default config
-    component = ResourceConsumerComponent()
-    assert component.resource_type == "food"
-    assert component.consumption_rate == 1.0
-    assert component.energy_conversion == 0.5
-    
-    # Test with custom config
-    config = ConsumerConfig(
-        resource_type="plants",
-        consumption_rate=2.0,
-        energy_conversion=0.8
-    )
-    component = ResourceConsumerComponent(config=config)
-    assert component.resource_type == "plants"
-    assert component.consumption_rate == 2.0
-    assert component.energy_conversion == 0.8
 
-
-def test_resource_consumption():
+@pytest.mark.parametrize("rtype,rate,conversion,consumed,expected_energy", [
+    ("food", 1.0, 0.5, 2.0, 51.0),    # 50 + (2.0 * 0.5)
+    ("food", 1.0, 0.5, 0.0, 50.0),    # depleted resource, no energy gained
+    ("plants", 1.0, 1.0, 1.0, 51.0),  # custom resource type
+])
+def test_resource_consumption(entity, stub_env, rtype, rate, conversion, consumed, expected_energy):
     """Test resource consumption and energy conversion."""
-    consumer = ResourceConsumerComponent()
+    config = ConsumerConfig(
+        resource_type=rtype,
+        consumption_rate=rate,
+        energy_conversion=conversion
+    )
+    consumer = ResourceConsumerComponent(config=config)
     energy = EnergyComponent(energy=50.0)
-    entity = Entity()
     entity.add_component("energy", energy)
-    
-    env = MagicMock()
-    env.consume_resource.return_value = 2.0
-    
-    consumer.update(entity, env)
-    
-    # Check energy was gained
-    assert energy.energy == 51.0  # 50 + (2.0 * 0.5)
+    stub_env.consume_resource_return = consumed
 
+    consumer.update(entity, stub_env)
 
-def test_resource_consumption_without_energy():
-    """Test resource consumption without energy component."""
-    consumer = ResourceConsumerComponent()
-    entity = Entity()
-    env = MagicMock()
-    
-    consumer.update(entity, env)
-    env.consume_resource.assert_not_called()
+    assert energy.energy == expected_energy
+    assert stub_env.consume_calls == [(entity.position, rtype, rate)]
 
 
-def test_resource_consumption_depletes_resource():
-    """Test that resource is properly depleted."""
+def test_resource_consumption_without_energy(bare_entity, stub_env):
+    """Test resource consumption without energy component."""
     consumer = ResourceConsumerComponent()
-    energy = EnergyComponent(energy=50.0)
-    entity = Entity()
-    entity.add_component("energy", energy)
-    
-    env = MagicMock()
-    env.consume_resource.return_value = 0.0
-    
-    consumer.update(entity, env)
-    assert energy.energy == 50.0  # No energy gained
-
-
-def test_different_resource_types():
-    """Test consuming different resource types."""
-    config = ConsumerConfig(
-        resource_type="plants",
-        consumption_rate=1.0,
-        energy_conversion=1.0
-    )
-    consumer = ResourceConsumerComponent(config=config)
-    energy = EnergyComponent(energy=50.0)
-    entity = Entity()
-    entity.add_component("energy", energy)
-    
-    env = MagicMock()
-    env.consume_resource.return_value = 1.0
-    
-    consumer.update(entity, env)
-    env.consume_resource.assert_called_once_with(entity.position, "plants", 1.0)
 
+    consumer.update(bare_entity, stub_env)
+    assert stub_env.consume_calls == []
 
-def test_reproduction_component_initialization():
-    """Test reproduction component initialization."""
-    # Test with default config
-    component = ReproductionComponent()
-    assert component.reproduction_threshold == 80.0
-    assert component.reproduction_cost == 50.0
-    assert component.reproduction_chance == 0.1
-    assert component.offspring_energy == 50.0
-    assert component.mutation_rate == 0.1
-    assert component.inherit_components == {
-        "energy": True,
-        "movement": True,
-        "consumer": True,
-        "reproduction": True,
-    }
-    
-    # Test with custom config
-    config = ReproductionConfig(
-        reproduction_threshold=100.0,
-        reproduction_cost=60.0,
-        reproduction_chance=0.2,
-        offspring_energy=40.0,
-        mutation_rate=0.2,
-        inherit_components={"energy": True, "movement": False}
-    )
-    component = ReproductionComponent(config=config)
-    assert component.reproduction_threshold == 100.0
-    assert component.reproduction_cost == 60.0
-    assert component.reproduction_chance == 0.2
-    assert component.offspring_energy == 40.0
-    assert component.mutation_rate == 0.2
-    assert component.inherit_components == {"energy": True, "movement": False}
 
-
-def test_reproduction_without_energy():
+def test_reproduction_without_energy(bare_entity, stub_env):
     """Test that reproduction fails without energy component."""
     component = ReproductionComponent()
-    entity = Entity()
-    env = MagicMock()
-    
-    component.update(entity, env)
-    env.add_entity.assert_not_called()
 
+    component.update(bare_entity, stub_env)
+    assert stub_env.added == []
 
-def test_reproduction_insufficient_energy():
+
+def test_reproduction_insufficient_energy(bare_entity, stub_env):
     """Test that reproduction fails with insufficient energy."""
     component = ReproductionComponent()
-    entity = Entity()
     energy = EnergyComponent(energy=70.0)  # Below reproduction threshold
-    entity.add_component("energy", energy)
-    env = MagicMock()
-    
-    component.update(entity, env)
-    env.add_entity.assert_not_called()
-
+    bare_entity.add_component("energy", energy)
+
+    component.update(bare_entity, stub_env)
+    assert stub_env.added == []
+
+
+@pytest.mark.parametrize("repro_config,expect_movement,expect_mutation", [
+    pytest.param(
+        ReproductionConfig(),
+        True, False, id="inherit-all"
+    ),
+    pytest.param(
+        ReproductionConfig(mutation_rate=0.5),
+        True, True, id="mutation"
+    ),
+    pytest.param(
+        ReproductionConfig(inherit_components={"energy": True, "movement": False}),
+        False, False, id="custom-inheritance"
+    ),
+])
+def test_reproduction_with_inheritance(monkeypatch, environment, repro_config,
+                                       expect_movement, expect_mutation):
+    """Test reproduction with inheritance, mutation and custom settings."""
+    # Always reproduce (and mutate), scoped to the components module
+    monkeypatch.setattr(
+        "virtuallife.simulation.components.random.random", lambda: 0.0
+    )
 
-@patch('random.random', return_value=0.0)  # Always reproduce
-def test_successful_reproduction(_mock_random):
-    """Test successful reproduction with component inheritance."""
     # Create parent entity with components
     parent = Entity(position=(5, 5))
-    parent.add_component("energy", EnergyComponent(energy=100.0))
-    config = MovementConfig(speed=1.0)
-    parent.add_component("movement", MovementComponent(config=config))
-    parent.add_component("reproduction", ReproductionComponent())
-    
-    # Create environment
-    env = Environment(10, 10)
-    env.add_entity(parent)
-    
-    # Initial entity count
-    initial_count = len(env.entities)
-    
-    # Update reproduction
-    parent.get_component("reproduction").update(parent, env)
-    
-    # Verify offspring was created
-    assert len(env.entities) == initial_count + 1
-    
-    # Find offspring (the new entity)
-    offspring_id = next(eid for eid in env.entities.keys() if eid != parent.id)
-    offspring = env.entities[offspring_id]
-    
-    # Verify offspring has inherited components
+    parent.add_component(
+        "energy", EnergyComponent(energy=100.0, config=EnergyConfig(decay_rate=0.1))
+    )
+    parent.add_component(
+        "movement", MovementComponent(config=MovementConfig(speed=1.0, movement_cost=0.1))
+    )
+    reproduction = ReproductionComponent(config=repro_config)
+    parent.add_component("reproduction", reproduction)
+    environment.add_entity(parent)
+
+    # Update reproduction; the offspring is returned directly
+    offspring = reproduction.update(parent, environment)
+
+    # Verify offspring was created and added to the environment
+    assert offspring is not None
+    assert offspring.id in environment.entities
+    assert len(environment.entities) == 2
+
+    # Verify inheritance settings were respected
     assert offspring.has_component("energy")
-    assert offspring.has_component("movement")
-    assert offspring.has_component("reproduction")
-    
+    assert offspring.has_component("movement") == expect_movement
+
     # Verify parent's energy was reduced
     parent_energy = parent.get_component("energy")
-    assert parent_energy.energy == 50.0  # 100 - reproduction_cost
+    assert parent_energy.energy == 100.0 - repro_config.reproduction_cost
+
+    if expect_mutation:
+        # Verify values are different due to mutation
+        offspring_energy = offspring.get_component_typed("energy", EnergyComponent)
+        offspring_movement = offspring.get_component_typed("movement", MovementComponent)
+        assert offspring_energy.decay_rate != 0.1
+        assert offspring_movement.speed != 1.0
+        assert offspring_movement.movement_cost != 0.1
 
 
-@patch('random.random', return_value=1.0)  # Never reproduce
-def test_reproduction_chance(_mock_random):
+def test_reproduction_chance(monkeypatch, bare_entity, stub_env):
     """Test that reproduction chance prevents constant reproduction."""
+    # Never reproduce
+    monkeypatch.setattr(
+        "virtuallife.simulation.components.random.random", lambda: 1.0
+    )
     component = ReproductionComponent()
-    entity = Entity()
-    entity.add_component("energy", EnergyComponent(energy=100.0))
-    env = MagicMock()
-    
-    component.update(entity, env)
-    env.add_entity.assert_not_called()
-
+    bare_entity.add_component("energy", EnergyComponent(energy=100.0))
 
-def test_mutation_in_offspring():
-    """Test that offspring components have mutated values."""
-    # Create parent with specific values
-    parent = Entity()
-    parent.add_component("energy", EnergyComponent(energy=100.0, config=EnergyConfig(decay_rate=0.1)))
-    parent.add_component("movement", MovementComponent(config=MovementConfig(speed=1.0, movement_cost=0.1)))
-    reproduction = ReproductionComponent(config=ReproductionConfig(mutation_rate=0.5))  # High mutation rate for testing
-    parent.add_component("reproduction", reproduction)
-    
-    # Create environment
-    env = Environment(10, 10)
-    env.add_entity(parent)
-    
-    # Force reproduction
-    with patch('random.random', return_value=0.0):  # Always reproduce
-        reproduction.update(parent, env)
-    
-    # Find offspring
-    offspring_id = next(eid for eid in env.entities.keys() if eid != parent.id)
-    offspring = env.entities[offspring_id]
-    
-    # Get offspring components
-    offspring_energy = offspring.get_component_typed("energy", EnergyComponent)
-    offspring_movement = offspring.get_component_typed("movement", MovementComponent)
-    
-    # Verify values are different due to mutation
-    assert offspring_energy.decay_rate != 0.1
-    assert offspring_movement.speed != 1.0
-    assert offspring_movement.movement_cost != 0.1
-
-
-def test_custom_inheritance_settings():
-    """Test that custom inheritance settings are respected."""
-    # Create parent with all components
-    parent = Entity()
-    parent.add_component("energy", EnergyComponent())
-    parent.add_component("movement", MovementComponent())
-    
-    # Create reproduction component that only inherits energy
-    config = ReproductionConfig(inherit_components={"energy": True, "movement": False})
-    reproduction = ReproductionComponent(config=config)
-    parent.add_component("reproduction", reproduction)
-    
-    # Create environment
-    env = Environment(10, 10)
-    env.add_entity(parent)
-    
-    # Force reproduction
-    with patch('random.random', return_value=0.0):  # Always reproduce
-        reproduction.update(parent, env)
-    
-    # Find offspring
-    offspring_id = next(eid for eid in env.entities.keys() if eid != parent.id)
-    offspring = env.entities[offspring_id]
-    
-    # Verify inheritance
-    assert offspring.has_component("energy")
-    assert not offspring.has_component("movement") 
\ No newline at end of file
+    component.update(bare_entity, stub_env)
+    assert stub_env.added == []
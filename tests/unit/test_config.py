@@ -1,10 +1,5 @@
 """Unit tests for the configuration system."""
 
-import os
-from pathlib import Path
-import tempfile
-import time
-
 import pytest
 import yaml
 from pydantic import ValidationError
@@ -26,9 +21,9 @@ from virtuallife.config.loader import (
 )
 
 
-def test_default_config():
+def test_default_config(default_config_template):
     """Test default configuration values."""
-    config = get_default_config()
+    config = default_config_template
     
     # Test environment defaults
     assert config.environment.width == 30
@@ -64,67 +59,52 @@ def test_default_config():
     assert config.step_delay == 0.5
 
 
-def test_config_validation():
-    """Test configuration validation."""
-    # Test invalid environment size
-    with pytest.raises(ValidationError):
-        EnvironmentConfig(width=-1, height=100)
-    
-    # Test invalid energy values
-    with pytest.raises(ValidationError):
-        EnergyConfig(initial_energy=-50.0)
-    
-    # Test invalid movement values
-    with pytest.raises(ValidationError):
-        MovementConfig(speed=-1.0)
-    
-    # Test invalid reproduction values
-    with pytest.raises(ValidationError):
-        ReproductionConfig(reproduction_chance=1.5)  # Must be between 0 and 1
-    
-    # Test invalid consumer values
+@pytest.mark.parametrize("model_cls,kwargs", [
+    pytest.param(EnvironmentConfig, {"width": -1, "height": 100}, id="negative-width"),
+    pytest.param(EnergyConfig, {"initial_energy": -50.0}, id="negative-energy"),
+    pytest.param(MovementConfig, {"speed": -1.0}, id="negative-speed"),
+    pytest.param(ReproductionConfig, {"reproduction_chance": 1.5}, id="chance-above-one"),
+    pytest.param(ConsumerConfig, {"consumption_rate": 0.0}, id="zero-consumption"),
+    pytest.param(ResourceConfig, {"initial_density": 2.0}, id="density-above-one"),
+])
+def test_config_validation(model_cls, kwargs):
+    """Test that invalid configuration values are rejected."""
     with pytest.raises(ValidationError):
-        ConsumerConfig(consumption_rate=0.0)  # Must be positive
-    
-    # Test invalid resource values
-    with pytest.raises(ValidationError):
-        ResourceConfig(initial_density=2.0)  # Must be between 0 and 1
+        model_cls(**kwargs)
 
 
-def test_save_and_load_config():
-    """Test saving and loading configuration."""
-    config = get_default_config()
-    
-    # Modify some values
+@pytest.fixture(scope="session")
+def saved_config_path(tmp_path_factory, default_config_template):
+    """Save a modified copy of the default config once per session.
+
+    Both round-trip tests read this file, so the YAML serialization and
+    the filesystem write happen a single time instead of once per test.
+    """
+    config = default_config_template.model_copy(deep=True)
     config.environment.width = 200
     config.energy.initial_energy = 150.0
     config.random_seed = 42
+
+    path = tmp_path_factory.mktemp("config") / "saved_config.yaml"
+    save_config(config, path)
+    return path
+
+
+def test_save_and_load_config(saved_config_path):
+    """Test saving and loading configuration."""
+    # Load the saved config
+    loaded_config = load_config(saved_config_path)
     
-    # Create a temporary file path
-    temp_dir = tempfile.gettempdir()
-    temp_path = os.path.join(temp_dir, f"test_config_{int(time.time())}.yaml")
+    # Verify loaded values match original
+    assert loaded_config.environment.width == 200
+    assert loaded_config.energy.initial_energy == 150.0
+    assert loaded_config.random_seed == 42
     
-    try:
-        # Save config
-        save_config(config, temp_path)
-        
-        # Load the saved config
-        loaded_config = load_config(temp_path)
-        
-        # Verify loaded values match original
-        assert loaded_config.environment.width == 200
-        assert loaded_config.energy.initial_energy == 150.0
-        assert loaded_config.random_seed == 42
-        
-        # Verify other values remain at defaults
-        assert loaded_config.environment.height == 30
-        assert loaded_config.environment.boundary_condition == "wrapped"
-        assert loaded_config.energy.max_energy == 100.0
-        assert loaded_config.step_delay == 0.5
-    finally:
-        # Clean up
-        if os.path.exists(temp_path):
-            os.unlink(temp_path)
+    # Verify other values remain at defaults
+    assert loaded_config.environment.height == 30
+    assert loaded_config.environment.boundary_condition == "wrapped"
+    assert loaded_config.energy.max_energy == 100.0
+    assert loaded_config.step_delay == 0.5
 
 
 def test_load_nonexistent_file():
@@ -133,27 +113,13 @@ def test_load_nonexistent_file():
         load_config("nonexistent.yaml")
 
 
-def test_load_invalid_yaml():
+def test_load_invalid_yaml(tmp_path):
     """Test loading invalid YAML."""
-    # Create a temporary file path
-    temp_dir = tempfile.gettempdir()
-    temp_path = os.path.join(temp_dir, f"test_invalid_{int(time.time())}.yaml")
-    
-    try:
-        # Write invalid YAML
-        with open(temp_path, 'w') as f:
-            f.write("invalid: yaml: :")
-        
-        with pytest.raises(yaml.YAMLError):
-            load_config(temp_path)
+    temp_path = tmp_path / "test_invalid.yaml"
+    temp_path.write_text("invalid: yaml: :")
     
-    finally:
-        # Clean up
-        if os.path.exists(temp_path):
-            try:
-                os.remove(temp_path)
-            except PermissionError:
-                pass  # Ignore Windows permission errors during cleanup
+    with pytest.raises(yaml.YAMLError):
+        load_config(temp_path)
 
 
 def test_load_or_default():
@@ -173,6 +139,14 @@ def test_load_or_default():
     assert config.step_delay == 0.5
 
 
+def test_load_or_default_with_existing_file(saved_config_path):
+    """Test that load_or_default loads an existing file."""
+    config = load_or_default(saved_config_path)
+    assert config.environment.width == 200
+    assert config.energy.initial_energy == 150.0
+    assert config.random_seed == 42
+
+
 def test_custom_config():
     """Test creating a custom configuration."""
     config = SimulationConfig(
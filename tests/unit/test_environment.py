@@ -14,12 +14,22 @@ class MockEntity:
         self.position = position
 
 
-@pytest.fixture
-def env():
-    """Create a test environment."""
+@pytest.fixture(scope="module")
+def _env_template():
+    """Single Environment instance shared by every test in this module."""
     return Environment(width=10, height=10)
 
 
+@pytest.fixture
+def env(_env_template):
+    """Create a test environment, reset between tests."""
+    _env_template.reset()
+    # test_normalize_position reassigns the boundary condition per parameter,
+    # so restore the default alongside the entity/resource reset.
+    _env_template.boundary_condition = "wrapped"
+    return _env_template
+
+
 @pytest.fixture
 def entity():
     """Create a test entity."""
@@ -106,6 +116,20 @@ def test_get_neighborhood(env):
         assert entity in neighborhood[entity.position]
 
 
+def test_reset(env, entity):
+    """Test resetting the environment to an empty state."""
+    env.add_entity(entity)
+    env.add_resource("food", (5, 5), 10.0)
+
+    env.reset()
+
+    assert len(env.entities) == 0
+    assert len(env.entity_positions) == 0
+    assert len(env.resources) == 0
+    assert env.width == 10
+    assert env.height == 10
+
+
 def test_resource_management(env):
     """Test resource management functions."""
     position = (5, 5)
@@ -1,5 +1,6 @@
 """Unit tests for the simulation runner module."""
 
+import logging
 from unittest.mock import MagicMock, patch
 import pytest
 import time
@@ -9,6 +10,27 @@ from virtuallife.simulation.environment import Environment
 from virtuallife.simulation.entity import Entity
 
 
+class _BufferingHandler(logging.Handler):
+    """Minimal logging handler that buffers records for assertions."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.records = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+
+@pytest.fixture
+def log_capture():
+    """Capture log records from the runner module without caplog overhead."""
+    handler = _BufferingHandler()
+    logger = logging.getLogger("virtuallife.simulation.runner")
+    logger.addHandler(handler)
+    yield handler
+    logger.removeHandler(handler)
+
+
 @pytest.fixture
 def environment():
     """Create a test environment."""
@@ -62,6 +84,18 @@ def test_notify_listeners(runner):
     assert called_data["args"]["test_arg"] == "value"
 
 
+def test_notify_listeners_logs_errors(runner, log_capture):
+    """Test that listener exceptions are logged and do not propagate."""
+    def failing_callback(sim, **kwargs):
+        raise RuntimeError("listener failure")
+
+    runner.add_listener("step_start", failing_callback)
+    runner.notify_listeners("step_start")
+
+    assert len(log_capture.records) == 1
+    assert "listener failure" in log_capture.records[0].getMessage()
+
+
 def test_step_updates_entities(environment):
     """Test that step updates all entities."""
     # Create mock entities
@@ -99,13 +133,15 @@ def test_run_for_steps(environment):
     assert not runner.running
 
 
+@pytest.mark.slow
+@pytest.mark.real_sleep
 def test_run_with_delay(environment):
     """Test running simulation with step delay."""
     runner = SimulationRunner(environment=environment, config={"step_delay": 0.1})
     
-    start_time = time.time()
+    start_time = time.monotonic()
     runner.run(steps=2)
-    elapsed_time = time.time() - start_time
+    elapsed_time = time.monotonic() - start_time
     
     assert elapsed_time >= 0.2  # At least 2 * 0.1 seconds
     assert runner.current_step == 2
@@ -1,54 +1,80 @@
 """Unit tests for visualization components."""
 
 import unittest.mock as mock
+from dataclasses import dataclass, field
+
 import pytest
-import matplotlib
-matplotlib.use('Agg')  # Use Agg backend to avoid Tk issues
+
+pytest.importorskip("matplotlib", reason="visualization tests need matplotlib")
 
 from virtuallife.visualize.base import Visualizer
 from virtuallife.visualize.console import ConsoleVisualizer
 from virtuallife.visualize.plotting import MatplotlibVisualizer
 from virtuallife.simulation.runner import SimulationRunner
-from virtuallife.simulation.environment import Environment
+from virtuallife.simulation.entity import Entity
+
+
+@dataclass
+class _EnvStub:
+    """Lightweight environment stand-in for the visualizers.
+
+    The visualizers only read attributes and probe cells, so a plain
+    dataclass avoids the spec introspection and per-attribute bookkeeping
+    a MagicMock(spec=Environment) pays for.
+    """
+
+    width: int = 3
+    height: int = 3
+    resources: dict = field(default_factory=dict)
+    entity_positions: dict = field(default_factory=dict)
+    entities: dict = field(default_factory=dict)
+
+    def get_entities_at(self, position):
+        ids = self.entity_positions.get(position, ())
+        return [self.entities[entity_id] for entity_id in ids]
 
 
 @pytest.fixture
 def mock_environment():
-    """Create a mock environment."""
-    env = mock.MagicMock(spec=Environment)
-    env.width = 3
-    env.height = 3
-    env.get_entities_at.return_value = []
-    env.resources = {}
-    env.entity_positions = {}
-    env.entities = []  # Add entities attribute
-    return env
+    """Create a stub environment."""
+    return _EnvStub()
+
+
+@pytest.fixture(scope="module")
+def _runner_mock_template():
+    """Spec'd runner mock built once per module, reset per test."""
+    return mock.MagicMock(spec=SimulationRunner)
 
 
 @pytest.fixture
-def mock_runner(mock_environment):
+def mock_runner(_runner_mock_template, mock_environment):
     """Create a mock runner with environment."""
-    runner = mock.MagicMock(spec=SimulationRunner)
+    runner = _runner_mock_template
+    runner.reset_mock(return_value=True, side_effect=True)
     runner.environment = mock_environment
     runner.current_step = 5
     return runner
 
 
+@pytest.fixture(scope="module")
+def _plt_mock_template():
+    """Mocked plt module built once per module, reset per test."""
+    return mock.MagicMock()
+
+
 @pytest.fixture
-def mock_matplotlib(monkeypatch):
-    """Create a mock matplotlib module."""
-    mock_plt = mock.MagicMock()
-    mock_fig = mock.MagicMock()
-    mock_ax = mock.MagicMock()
-    mock_plt.subplots.return_value = (mock_fig, mock_ax)
-    
-    # Mock numpy for array operations
-    mock_np = mock.MagicMock()
-    mock_np.c_ = mock.MagicMock()
-    mock_np.zeros.return_value = mock.MagicMock()
+def mock_matplotlib(_plt_mock_template, monkeypatch):
+    """Create a mock matplotlib module.
+
+    Only plt is mocked; the visualizer's numpy calls run against the real
+    module, which is cheaper than a MagicMock spawning a child mock per
+    attribute access and keeps the array maths honest.
+    """
+    mock_plt = _plt_mock_template
+    mock_plt.reset_mock(return_value=True, side_effect=True)
+    mock_plt.subplots.return_value = (mock.MagicMock(), mock.MagicMock())
     
     monkeypatch.setattr('virtuallife.visualize.plotting.plt', mock_plt)
-    monkeypatch.setattr('virtuallife.visualize.plotting.np', mock_np)
     
     return mock_plt
 
@@ -80,19 +106,38 @@ def test_console_visualizer_setup(mock_runner):
     mock_runner.add_listener.assert_called_once_with("step_end", visualizer.update)
 
 
-def test_console_visualizer_update(mock_runner):
+def test_console_visualizer_update(mock_runner, capsys):
     """Test update method of the ConsoleVisualizer."""
     # Arrange
     visualizer = ConsoleVisualizer()
     visualizer.setup(mock_runner)
     
     # Act
-    with mock.patch('os.system') as mock_clear:
-        visualizer.update(mock_runner)
+    visualizer.update(mock_runner)
+    
+    # Assert
+    output = capsys.readouterr().out
+    assert output.startswith("\x1b[2J\x1b[H")  # ANSI clear + cursor home
+    assert output.count("· · ·") == 3  # 3x3 empty grid
+
+
+def test_console_visualizer_update_renders_entities(mock_runner, capsys):
+    """Test that occupied cells are rendered with the entity's symbol."""
+    # Arrange
+    visualizer = ConsoleVisualizer()
+    visualizer.setup(mock_runner)
+    
+    entity = Entity(position=(1, 1))
+    entity.add_component("plant", object())
+    mock_runner.environment.entities = {entity.id: entity}
+    mock_runner.environment.entity_positions = {(1, 1): {entity.id}}
+    
+    # Act
+    visualizer.update(mock_runner)
     
     # Assert
-    mock_clear.assert_called_once()
-    assert mock_runner.environment.get_entities_at.call_count == 9  # 3x3 grid
+    output = capsys.readouterr().out
+    assert "♣" in output
 
 
 def test_matplotlib_visualizer_initialization():
@@ -139,7 +184,7 @@ def test_matplotlib_visualizer_setup(mock_runner, mock_matplotlib):
     # Assert
     mock_matplotlib.ion.assert_called_once()
     mock_matplotlib.subplots.assert_called_once()
-    mock_matplotlib.title.assert_called_with("VirtualLife Simulation")
+    visualizer.ax.set_title.assert_called_with("VirtualLife Simulation")
     assert len(visualizer.scatter_plots) == 4  # default + 3 entity types
     assert visualizer.fig is not None
     assert visualizer.ax is not None
@@ -164,7 +209,7 @@ def test_matplotlib_visualizer_update(mock_runner, mock_matplotlib):
     # Each scatter plot should be updated
     for scatter in visualizer.scatter_plots.values():
         scatter.set_offsets.assert_called_once()
-    mock_matplotlib.title.assert_called_with(f"VirtualLife Simulation - Step {mock_runner.current_step}")
+    visualizer._title.set_text.assert_called_with(f"VirtualLife Simulation - Step {mock_runner.current_step}")
 
 
 def test_matplotlib_visualizer_cleanup(mock_matplotlib):
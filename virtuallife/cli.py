@@ -14,7 +14,7 @@ from rich.console import Console
 from rich.logging import RichHandler
 
 from virtuallife.config.loader import load_or_default, save_config
-from virtuallife.config.models import SimulationConfig
+from virtuallife.config.models import EnvironmentConfig, SimulationConfig
 from virtuallife.simulation.factory import setup_simulation
 
 # Set up logging with rich
@@ -35,6 +35,26 @@ app = typer.Typer(
 # Create a console for rich output
 console = Console()
 
+# Boundary conditions the environment understands
+_BOUNDARIES = frozenset({"wrapped", "bounded"})
+
+
+def _norm_boundary(boundary: str) -> str:
+    """Normalize a boundary condition name, falling back to 'wrapped'.
+
+    Args:
+        boundary: The boundary condition name as given on the command line
+
+    Returns:
+        The lowercased name if it is a known boundary condition, otherwise
+        'wrapped' (with a warning)
+    """
+    normalized = boundary.lower()
+    if normalized not in _BOUNDARIES:
+        logger.warning(f"Invalid boundary condition '{boundary}', using 'wrapped'")
+        return "wrapped"
+    return normalized
+
 
 @app.command("run")
 def run_simulation(
@@ -237,21 +257,19 @@ def create_config(
 ):
     """Create a new configuration file with custom settings."""
     try:
-        # Create configuration with custom settings
-        config = SimulationConfig()
-        
-        # Override environment settings
-        config.environment.width = width
-        config.environment.height = height
-        if boundary.lower() in ["wrapped", "bounded"]:
-            config.environment.boundary_condition = boundary.lower()
-        else:
-            logger.warning(f"Invalid boundary condition '{boundary}', using 'wrapped'")
-            config.environment.boundary_condition = "wrapped"
-        config.environment.initial_entities = entities
-        
-        # Set other options
-        config.random_seed = random_seed
+        boundary_condition = _norm_boundary(boundary)
+
+        # Create configuration with custom settings in a single validated
+        # construction instead of building defaults and mutating them
+        config = SimulationConfig(
+            environment=EnvironmentConfig(
+                width=width,
+                height=height,
+                boundary_condition=boundary_condition,
+                initial_entities=entities,
+            ),
+            random_seed=random_seed,
+        )
         
         # Save the configuration
         save_config(config, output_path)
@@ -2,23 +2,27 @@
 
 This package provides configuration management functionality using Pydantic models,
 including loading from YAML files and validation.
+
+The re-exports below are resolved lazily (PEP 562) so importing the package
+does not pull in Pydantic or PyYAML until a config class or loader function
+is actually used.
 """
 
-from virtuallife.config.models import (
-    SimulationConfig,
-    EnvironmentConfig,
-    EnergyConfig,
-    MovementConfig,
-    ReproductionConfig,
-    ConsumerConfig,
-    ResourceConfig,
-)
-from virtuallife.config.loader import (
-    load_config,
-    save_config,
-    get_default_config,
-    load_or_default,
-)
+_MODEL_EXPORTS = {
+    'SimulationConfig',
+    'EnvironmentConfig',
+    'EnergyConfig',
+    'MovementConfig',
+    'ReproductionConfig',
+    'ConsumerConfig',
+    'ResourceConfig',
+}
+_LOADER_EXPORTS = {
+    'load_config',
+    'save_config',
+    'get_default_config',
+    'load_or_default',
+}
 
 __all__ = [
     'SimulationConfig',
@@ -32,4 +36,15 @@ __all__ = [
     'save_config',
     'get_default_config',
     'load_or_default',
-] 
\ No newline at end of file
+]
+
+
+def __getattr__(name: str):
+    """Resolve re-exported names on first access."""
+    if name in _MODEL_EXPORTS:
+        from virtuallife.config import models
+        return getattr(models, name)
+    if name in _LOADER_EXPORTS:
+        from virtuallife.config import loader
+        return getattr(loader, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
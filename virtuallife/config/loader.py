@@ -5,24 +5,107 @@ from/to YAML files, with validation using Pydantic models.
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Union
+from typing import TYPE_CHECKING, Optional, Union
 
-import yaml
-from pydantic import ValidationError
+if TYPE_CHECKING:
+    from virtuallife.config.models import SimulationConfig
 
-from virtuallife.config.models import SimulationConfig
+# PyYAML and the Pydantic models are imported on first use so that merely
+# importing this module stays cheap; both imports are amortized behind
+# lru_cache once config I/O actually runs.
 
 
-def load_config(config_path: Union[str, Path]) -> SimulationConfig:
+@lru_cache(maxsize=1)
+def _yaml():
+    """Import PyYAML on first use, preferring the libyaml-backed classes.
+
+    Returns:
+        A (module, loader class, dumper class) triple; the C-accelerated
+        loader and dumper parse and emit YAML several times faster than the
+        pure-Python implementations when libyaml is available.
+    """
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+    return yaml, loader, dumper
+
+
+@lru_cache(maxsize=1)
+def _nested_models() -> dict:
+    """Map SimulationConfig field names to their nested model classes.
+
+    Used to rebuild trusted configs without a validation pass.
+    """
+    from virtuallife.config.models import (
+        ConsumerConfig,
+        EnergyConfig,
+        EnvironmentConfig,
+        MovementConfig,
+        ReproductionConfig,
+        ResourceConfig,
+    )
+
+    return {
+        "environment": EnvironmentConfig,
+        "energy": EnergyConfig,
+        "movement": MovementConfig,
+        "reproduction": ReproductionConfig,
+        "consumer": ConsumerConfig,
+        "resources": ResourceConfig,
+    }
+
+
+@lru_cache(maxsize=1)
+def _config_adapter():
+    """Build the TypeAdapter for SimulationConfig once and reuse it.
+
+    The adapter compiles its validator on first use; caching it means
+    repeated load_config calls reuse the compiled validator instead of
+    paying constructor dispatch per call.
+    """
+    from pydantic import TypeAdapter
+
+    from virtuallife.config.models import SimulationConfig
+
+    return TypeAdapter(SimulationConfig)
+
+
+def _construct_trusted(config_dict: dict) -> "SimulationConfig":
+    """Build a SimulationConfig from known-good data without validation.
+
+    Args:
+        config_dict: Configuration data that has already been validated
+            (e.g. written by save_config)
+
+    Returns:
+        Configuration built via model_construct, skipping coercion and
+        validation
+    """
+    from virtuallife.config.models import SimulationConfig
+
+    data = dict(config_dict)
+    for key, model_cls in _nested_models().items():
+        if isinstance(data.get(key), dict):
+            data[key] = model_cls.model_construct(**data[key])
+    return SimulationConfig.model_construct(**data)
+
+
+def load_config(config_path: Union[str, Path], trusted: bool = False) -> "SimulationConfig":
     """Load a configuration from a YAML file.
-    
+
     Args:
         config_path: Path to the YAML configuration file
-        
+        trusted: If True, skip Pydantic validation and build the models
+            directly. Only use for files this package wrote itself (such
+            as the shipped default configuration); user-supplied YAML must
+            go through the validated path.
+
     Returns:
         Loaded and validated configuration
-        
+
     Raises:
         FileNotFoundError: If config file doesn't exist
         ValidationError: If config file contains invalid values
@@ -31,12 +114,21 @@ def load_config(config_path: Union[str, Path]) -> SimulationConfig:
     config_path = Path(config_path)
     if not config_path.exists():
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
-    
-    with open(config_path, 'r') as f:
-        config_dict = yaml.safe_load(f)
-    
+
+    yaml, yaml_loader, _ = _yaml()
+
+    # Binary mode lets the parser consume raw bytes and decode them itself,
+    # skipping Python's text-mode decoding layer.
+    with open(config_path, 'rb') as f:
+        config_dict = yaml.load(f, Loader=yaml_loader)
+
+    if trusted:
+        return _construct_trusted(config_dict)
+
+    from pydantic import ValidationError
+
     try:
-        config = SimulationConfig(**config_dict)
+        config = _config_adapter().validate_python(config_dict)
     except ValidationError as e:
         # Add file path context to validation error
         raise ValidationError(
@@ -48,7 +140,7 @@ def load_config(config_path: Union[str, Path]) -> SimulationConfig:
     return config
 
 
-def save_config(config: SimulationConfig, config_path: Union[str, Path]) -> None:
+def save_config(config: "SimulationConfig", config_path: Union[str, Path]) -> None:
     """Save a configuration to a YAML file.
     
     Args:
@@ -63,27 +155,48 @@ def save_config(config: SimulationConfig, config_path: Union[str, Path]) -> None
     # Create parent directories if they don't exist
     os.makedirs(config_path.parent, exist_ok=True)
     
+    yaml, _, yaml_dumper = _yaml()
+
     # Convert to dict and save as YAML
     config_dict = config.model_dump()
     with open(config_path, 'w') as f:
-        yaml.safe_dump(config_dict, f, sort_keys=False)
+        yaml.dump(
+            config_dict, f, Dumper=yaml_dumper, sort_keys=False, allow_unicode=True
+        )
 
 
-def get_default_config() -> SimulationConfig:
-    """Get a default configuration instance.
-    
-    Returns:
-        Default configuration loaded from examples/configs/default.yaml,
-        or a new instance with default values if the file is not found.
+@lru_cache(maxsize=1)
+def _default_config_template() -> "SimulationConfig":
+    """Load the default configuration once and cache it.
+
+    Tests that need a fresh read (e.g. after editing the default file) can
+    call ``_default_config_template.cache_clear()``.
     """
+    from pydantic import ValidationError
+
+    from virtuallife.config.models import SimulationConfig
+
     default_path = Path(__file__).parent.parent.parent / "examples" / "configs" / "default.yaml"
     try:
-        return load_config(default_path)
+        # The shipped default file is known-good, so skip validation
+        return load_config(default_path, trusted=True)
     except (FileNotFoundError, ValidationError):
         return SimulationConfig()
 
 
-def load_or_default(config_path: Optional[Union[str, Path]] = None) -> SimulationConfig:
+def get_default_config() -> "SimulationConfig":
+    """Get a default configuration instance.
+
+    Returns:
+        Default configuration loaded from examples/configs/default.yaml,
+        or a new instance with default values if the file is not found.
+        The file is read and parsed only once; callers get a deep copy of
+        the cached template so they are free to mutate it.
+    """
+    return _default_config_template().model_copy(deep=True)
+
+
+def load_or_default(config_path: Optional[Union[str, Path]] = None) -> "SimulationConfig":
     """Load configuration from file or return defaults if not found.
     
     Args:
@@ -5,12 +5,14 @@ ensuring type safety and validation for all simulation parameters.
 """
 
 from typing import Dict, Literal, Optional
-from pydantic import BaseModel, Field, NonNegativeFloat, PositiveFloat, PositiveInt
+from pydantic import BaseModel, ConfigDict, Field, NonNegativeFloat, PositiveFloat, PositiveInt
 
 
 class EnergyConfig(BaseModel):
     """Configuration for energy-related parameters."""
-    
+
+    model_config = ConfigDict(defer_build=True)
+
     initial_energy: PositiveFloat = Field(
         default=100.0,
         description="Initial energy level for new entities"
@@ -31,7 +33,9 @@ class EnergyConfig(BaseModel):
 
 class MovementConfig(BaseModel):
     """Configuration for movement-related parameters."""
-    
+
+    model_config = ConfigDict(defer_build=True)
+
     speed: PositiveFloat = Field(
         default=1.0,
         description="Movement speed (positions per step)"
@@ -44,7 +48,9 @@ class MovementConfig(BaseModel):
 
 class ResourceConfig(BaseModel):
     """Configuration for resource-related parameters."""
-    
+
+    model_config = ConfigDict(defer_build=True)
+
     resource_types: Dict[str, float] = Field(
         default={"food": 1.0},
         description="Dictionary of resource types and their base values"
@@ -67,7 +73,9 @@ class ResourceConfig(BaseModel):
 
 class ReproductionConfig(BaseModel):
     """Configuration for reproduction-related parameters."""
-    
+
+    model_config = ConfigDict(defer_build=True)
+
     reproduction_threshold: PositiveFloat = Field(
         default=80.0,
         description="Energy required to reproduce"
@@ -105,7 +113,9 @@ class ReproductionConfig(BaseModel):
 
 class ConsumerConfig(BaseModel):
     """Configuration for resource consumption parameters."""
-    
+
+    model_config = ConfigDict(defer_build=True)
+
     resource_type: str = Field(
         default="food",
         description="Type of resource to consume"
@@ -122,7 +132,9 @@ class ConsumerConfig(BaseModel):
 
 class EnvironmentConfig(BaseModel):
     """Configuration for environment parameters."""
-    
+
+    model_config = ConfigDict(defer_build=True)
+
     width: PositiveInt = Field(
         default=100,
         description="Width of the environment grid"
@@ -143,7 +155,9 @@ class EnvironmentConfig(BaseModel):
 
 class SimulationConfig(BaseModel):
     """Main configuration for the simulation."""
-    
+
+    model_config = ConfigDict(defer_build=True)
+
     environment: EnvironmentConfig = Field(
         default_factory=EnvironmentConfig,
         description="Environment configuration"
@@ -182,21 +182,24 @@ class ReproductionComponent:
         self.mutation_rate = self.config.mutation_rate
         self.inherit_components = self.config.inherit_components
 
-    def update(self, entity: "Entity", environment: "Environment") -> None:
+    def update(self, entity: "Entity", environment: "Environment") -> Optional["Entity"]:
         """Update reproduction state and potentially create offspring.
 
         Args:
             entity: The entity this component belongs to
             environment: The environment the entity exists in
+
+        Returns:
+            The offspring entity if reproduction occurred, None otherwise
         """
         # Check for energy component
         energy_component = entity.get_component_typed("energy", EnergyComponent)
         if energy_component is None or energy_component.energy < self.reproduction_threshold:
-            return
+            return None
 
         # Random chance to reproduce
         if random.random() > self.reproduction_chance:
-            return
+            return None
 
         # Create offspring with inherited components
         from virtuallife.simulation.entity import Entity  # Import here to avoid circular imports
@@ -225,6 +228,8 @@ class ReproductionComponent:
         # Add offspring to environment
         environment.add_entity(offspring)
 
+        return offspring
+
     def _create_mutated_component(self, component: Any) -> Any:
         """Create a new component with potentially mutated values.
         
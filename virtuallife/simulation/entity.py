@@ -4,6 +4,7 @@ This module provides the Entity class and the Component protocol, which form the
 foundation of the entity-component system used in the simulation.
 """
 
+import logging
 from dataclasses import dataclass, field
 from typing import Dict, Protocol, TypeVar, cast, Optional, Type, TYPE_CHECKING
 from uuid import UUID, uuid4
@@ -12,11 +13,16 @@ if TYPE_CHECKING:
     from virtuallife.simulation.environment import Environment
 
 
+logger = logging.getLogger(__name__)
+
+
 class Component(Protocol):
     """Protocol defining the interface for entity components.
     
     All components must implement this protocol to be usable with the Entity class.
-    The update method is called on each simulation step.
+    The update method is called on each simulation step. Components whose update
+    is a no-op (pure markers) can set a ``passive = True`` class attribute to be
+    skipped by the entity's per-step update loop.
     """
     def update(self, entity: "Entity", environment: "Environment") -> None:
         """Update the component state.
@@ -47,6 +53,20 @@ class Entity:
     id: UUID = field(default_factory=uuid4)
     position: tuple[int, int] = field(default=(0, 0))
     components: Dict[str, Component] = field(default_factory=dict)
+    # Cached tuple of components whose update must run each step, rebuilt
+    # whenever the component set changes.
+    _updaters: tuple = field(default=(), init=False, repr=False)
+    
+    def __post_init__(self) -> None:
+        self._rebuild_updaters()
+    
+    def _rebuild_updaters(self) -> None:
+        """Re-derive the components that need a per-step update call."""
+        self._updaters = tuple(
+            component
+            for component in self.components.values()
+            if not getattr(component, "passive", False)
+        )
     
     def add_component(self, name: str, component: Component) -> None:
         """Add a component to the entity.
@@ -61,6 +81,7 @@ class Entity:
         if name in self.components:
             raise ValueError(f"Component {name} already exists on this entity")
         self.components[name] = component
+        self._rebuild_updaters()
     
     def remove_component(self, name: str) -> None:
         """Remove a component from the entity.
@@ -70,6 +91,7 @@ class Entity:
         """
         if name in self.components:
             del self.components[name]
+            self._rebuild_updaters()
     
     def has_component(self, name: str) -> bool:
         """Check if the entity has a specific component.
@@ -114,12 +136,10 @@ class Entity:
         Args:
             environment: The environment the entity exists in
         """
-        # Update each component
-        for component in self.components.values():
+        # Update each component that opted into per-step updates
+        for component in self._updaters:
             try:
                 component.update(self, environment)
             except Exception as e:
                 # Log the error but continue with other components
-                import logging
-                logger = logging.getLogger(__name__)
                 logger.error(f"Error updating component {component}: {str(e)}") 
\ No newline at end of file
@@ -6,6 +6,7 @@ and defines the boundaries of the simulation space.
 """
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Dict, Set, Tuple, List, Optional, TYPE_CHECKING
 from uuid import UUID
 from collections import defaultdict
@@ -14,6 +15,27 @@ if TYPE_CHECKING:
     from virtuallife.simulation.entity import Entity
 
 
+@lru_cache(maxsize=32)
+def _neighborhood_offsets(radius: int) -> Tuple[Tuple[int, int], ...]:
+    """Return the relative (dx, dy) offsets covering a square neighborhood.
+
+    The offsets depend only on the radius, so they are computed once per
+    radius and reused by every get_neighborhood call instead of rebuilding
+    the same (2*radius+1)**2 nested ranges on each query.
+
+    Args:
+        radius: The radius of the neighborhood
+
+    Returns:
+        A tuple of (dx, dy) offsets
+    """
+    return tuple(
+        (dx, dy)
+        for dx in range(-radius, radius + 1)
+        for dy in range(-radius, radius + 1)
+    )
+
+
 @dataclass
 class Environment:
     """A 2D grid environment for the simulation.
@@ -56,6 +78,17 @@ class Environment:
         self.entity_positions: Dict[Tuple[int, int], Set[UUID]] = defaultdict(set)
         self.resources: Dict[str, Dict[Tuple[int, int], float]] = defaultdict(lambda: defaultdict(float))
 
+    def reset(self) -> None:
+        """Reset the environment to an empty state.
+
+        Clears all entities, entity positions, and resources while keeping
+        the grid dimensions and boundary condition. This is much cheaper
+        than building a new Environment when one needs to be reused.
+        """
+        self.entities.clear()
+        self.entity_positions.clear()
+        self.resources.clear()
+
     def add_entity(self, entity: "Entity") -> None:
         """Add an entity to the environment.
         
@@ -117,12 +150,11 @@ class Environment:
         x, y = position
         neighborhood = {}
         
-        for dx in range(-radius, radius + 1):
-            for dy in range(-radius, radius + 1):
-                pos = self.normalize_position((x + dx, y + dy))
-                entities = self.get_entities_at(pos)
-                if entities:
-                    neighborhood[pos] = entities
+        for dx, dy in _neighborhood_offsets(radius):
+            pos = self.normalize_position((x + dx, y + dy))
+            entities = self.get_entities_at(pos)
+            if entities:
+                neighborhood[pos] = entities
         
         return neighborhood
     
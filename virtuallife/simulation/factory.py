@@ -6,7 +6,7 @@ with specific configurations and behaviors.
 
 import random
 import logging
-from typing import Optional, Tuple
+from typing import Optional, Tuple, TYPE_CHECKING
 
 from virtuallife.config.models import SimulationConfig
 from virtuallife.simulation.entity import Entity
@@ -18,8 +18,9 @@ from virtuallife.simulation.components import (
     ReproductionComponent,
     ResourceConsumerComponent
 )
-from virtuallife.visualize.console import ConsoleVisualizer
-from virtuallife.visualize.plotting import MatplotlibVisualizer
+if TYPE_CHECKING:
+    from virtuallife.visualize.console import ConsoleVisualizer
+    from virtuallife.visualize.plotting import MatplotlibVisualizer
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +28,9 @@ logger = logging.getLogger(__name__)
 class MarkerComponent:
     """A simple marker component to identify entity types."""
     
+    # Markers carry no per-step behavior; skip them in Entity.update
+    passive = True
+    
     def __init__(self, marker_type: str):
         """Initialize the marker component.
         
@@ -116,7 +120,7 @@ def create_predator(config: SimulationConfig, position: Tuple[int, int]) -> Enti
 def setup_simulation(
     config: SimulationConfig,
     visualizer_type: str = "none"
-) -> Tuple[SimulationRunner, Optional[ConsoleVisualizer | MatplotlibVisualizer]]:
+) -> Tuple[SimulationRunner, Optional["ConsoleVisualizer | MatplotlibVisualizer"]]:
     """Set up a simulation with the given configuration.
     
     Args:
@@ -177,12 +181,18 @@ def setup_simulation(
     # Create simulation runner
     runner = SimulationRunner(environment=environment, config=config.model_dump())
     
-    # Set up visualization if requested
+    # Set up visualization if requested. The visualizer modules are imported
+    # lazily so CLI commands that never render (info, create-config, --no-vis
+    # runs) do not pay the matplotlib import at startup.
     visualizer = None
     if visualizer_type == "console":
+        from virtuallife.visualize.console import ConsoleVisualizer
+
         visualizer = ConsoleVisualizer()
         visualizer.setup(runner)
     elif visualizer_type == "matplotlib":
+        from virtuallife.visualize.plotting import MatplotlibVisualizer
+
         visualizer = MatplotlibVisualizer()
         visualizer.setup(runner)
     
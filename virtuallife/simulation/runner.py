@@ -52,6 +52,11 @@ class SimulationRunner:
         "entity_added": [],
         "entity_removed": []
     })
+    # Tuple snapshots of the listener lists, rebuilt on add_listener so
+    # notify_listeners iterates the fastest possible sequence on the hot path.
+    _listener_snapshots: Dict[str, tuple] = field(
+        default_factory=dict, init=False, repr=False
+    )
 
     def add_listener(self, event_type: str, callback: Callable) -> None:
         """Add a listener for a specific event type.
@@ -76,6 +81,7 @@ class SimulationRunner:
             raise ValueError(f"Unsupported event type: {event_type}")
 
         self.listeners[event_type].append(callback)
+        self._listener_snapshots[event_type] = tuple(self.listeners[event_type])
 
     def notify_listeners(self, event_type: str, **kwargs) -> None:
         """Notify all listeners of an event.
@@ -96,12 +102,16 @@ class SimulationRunner:
             >>> data["called"]
             True
         """
-        if event_type in self.listeners:
-            for callback in self.listeners[event_type]:
-                try:
-                    callback(self, **kwargs)
-                except Exception as e:
-                    logger.error(f"Error in {event_type} listener: {str(e)}")
+        # Short-circuit the common case of an event with no listeners
+        callbacks = self._listener_snapshots.get(event_type)
+        if not callbacks:
+            return
+
+        for callback in callbacks:
+            try:
+                callback(self, **kwargs)
+            except Exception as e:
+                logger.error(f"Error in {event_type} listener: {str(e)}")
 
     def step(self) -> None:
         """Execute a single simulation step.
@@ -123,7 +133,7 @@ class SimulationRunner:
             self.current_step += 1
 
             # Update all entities (make a copy to handle removals during iteration)
-            entities = list(self.environment.entities.values())
+            entities = tuple(self.environment.entities.values())
             for entity in entities:
                 try:
                     entity.update(self.environment)
@@ -153,14 +163,22 @@ class SimulationRunner:
         self.running = True
         step_count = 0
 
+        # Optional delay for real-time visualization, paced against a
+        # monotonic deadline so step work counts toward the delay and the
+        # cadence does not drift when steps are slow.
+        step_delay = self.config.get("step_delay", 0)
+        deadline = time.monotonic()
+
         try:
             while self.running and (steps is None or step_count < steps):
                 self.step()
                 step_count += 1
 
-                # Optional sleep for real-time visualization
-                if "step_delay" in self.config:
-                    time.sleep(self.config["step_delay"])
+                if step_delay:
+                    deadline += step_delay
+                    remaining = deadline - time.monotonic()
+                    if remaining > 0:
+                        time.sleep(remaining)
         except Exception as e:
             logger.error(f"Error during simulation run: {str(e)}")
         finally:
@@ -30,6 +30,14 @@ class ConsoleVisualizer(Visualizer):
         }
         self.empty_symbol = "·"
         self.runner = None
+        self._grid = None
+        self._empty_row = None
+        # Priority-ordered (component name, symbol) pairs, resolved once so
+        # per-cell symbol lookup is a short loop over a prebuilt tuple.
+        self._symbol_priority = tuple(
+            (name, self.entity_symbols[name])
+            for name in ("predator", "herbivore", "plant")
+        )
     
     def setup(self, runner: SimulationRunner) -> None:
         """Set up the visualizer and attach to simulation events.
@@ -40,9 +48,27 @@ class ConsoleVisualizer(Visualizer):
         self.runner = runner
         runner.add_listener("step_end", self.update)
     
+    def get_entity_symbol(self, entity: Any) -> str:
+        """Get the display symbol for an entity based on its components.
+
+        Args:
+            entity: The entity to resolve a symbol for
+
+        Returns:
+            The symbol for the highest-priority component the entity has
+        """
+        for name, symbol in self._symbol_priority:
+            if entity.has_component(name):
+                return symbol
+        return self.entity_symbols["default"]
+
     def clear_screen(self) -> None:
         """Clear the console screen."""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        if os.name == 'nt':
+            os.system('cls')
+        else:
+            # ANSI clear + cursor home; avoids forking a shell every frame
+            sys.stdout.write('\x1b[2J\x1b[H')
     
     def update(self, simulation: SimulationRunner, **kwargs: Any) -> None:
         """Update the visualization.
@@ -57,33 +83,33 @@ class ConsoleVisualizer(Visualizer):
         self.clear_screen()
         env = simulation.environment
         
-        # Print simulation info
-        print(f"Step: {simulation.current_step}")
-        print(f"Entities: {len(env.entities)}")
-        print()
-        
-        # Print grid
-        for y in range(env.height - 1, -1, -1):  # Print from top to bottom
-            for x in range(env.width):
-                pos = (x, y)
-                entities = env.get_entities_at(pos)
-                if entities:
-                    # For now, just print the first entity at each position
-                    entity = entities[0]
-                    # Determine entity type based on components
-                    if entity.has_component("predator"):
-                        symbol = self.entity_symbols["predator"]
-                    elif entity.has_component("herbivore"):
-                        symbol = self.entity_symbols["herbivore"]
-                    elif entity.has_component("plant"):
-                        symbol = self.entity_symbols["plant"]
-                    else:
-                        symbol = self.entity_symbols["default"]
-                    print(symbol, end=" ")
-                else:
-                    print(self.empty_symbol, end=" ")
-            print()  # New line at end of row
-        print()  # Extra line after grid
+        # Reuse a preallocated grid buffer, reset to empty each frame
+        width, height = env.width, env.height
+        if self._grid is None or len(self._grid) != height or len(self._empty_row) != width:
+            self._empty_row = [self.empty_symbol] * width
+            self._grid = [list(self._empty_row) for _ in range(height)]
+        else:
+            for row in self._grid:
+                row[:] = self._empty_row
+
+        # Single pass over the occupied cells instead of probing every cell
+        for (x, y), entity_ids in env.entity_positions.items():
+            if entity_ids and 0 <= x < width and 0 <= y < height:
+                # For now, just show the first entity at each position
+                entity = env.entities[next(iter(entity_ids))]
+                self._grid[y][x] = self.get_entity_symbol(entity)
+
+        # Render the full frame into one buffer and emit it with a single
+        # write; rows are rendered from top (y = height - 1) to bottom.
+        lines = [
+            f"Step: {simulation.current_step}",
+            f"Entities: {len(env.entities)}",
+            "",
+        ]
+        lines.extend(" ".join(self._grid[y]) for y in range(height - 1, -1, -1))
+        lines.append("")  # Extra line after grid
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
     
     def cleanup(self) -> None:
         """Clean up any resources used by the visualizer."""
@@ -40,6 +40,11 @@ class MatplotlibVisualizer(Visualizer):
         self.ax = None
         self.scatter_plots = {}
         self.resource_plot = None
+        self._resource_buffer = None
+        self._title = None
+        # Priority-ordered component names, resolved once instead of
+        # rebuilding the list for every occupied cell each frame.
+        self._category_priority = ("plant", "herbivore", "predator")
     
     def setup(self, runner: SimulationRunner) -> None:
         """Set up the visualizer and attach to simulation events.
@@ -78,8 +83,12 @@ class MatplotlibVisualizer(Visualizer):
         
         # Create resource plot if environment has resources
         if runner.environment.resources:
+            # Reusable buffer for rasterizing the sparse resource dict each frame
+            self._resource_buffer = np.zeros(
+                (runner.environment.height, runner.environment.width)
+            )
             self.resource_plot = self.ax.imshow(
-                np.zeros((runner.environment.height, runner.environment.width)),
+                self._resource_buffer,
                 cmap='YlGn',
                 alpha=0.3,
                 extent=(-0.5, runner.environment.width - 0.5, -0.5, runner.environment.height - 0.5)
@@ -88,7 +97,7 @@ class MatplotlibVisualizer(Visualizer):
         # Place legend completely outside the plot with adaptive positioning
         bbox_x = 1.02 if grid_ratio <= 2 else 1.01  # Closer to plot for wide grids
         self.ax.legend(bbox_to_anchor=(bbox_x, 1), loc='upper left')
-        plt.title("VirtualLife Simulation")
+        self._title = self.ax.set_title("VirtualLife Simulation")
         
         # Attach to simulation events
         runner.add_listener("step_end", self.update)
@@ -102,8 +111,10 @@ class MatplotlibVisualizer(Visualizer):
         """
         env = runner.environment
         
-        # Update title with simulation info
-        plt.title(f"VirtualLife Simulation - Step {runner.current_step}")
+        # Update title text in place; recreating the title artist each frame
+        # forces a relayout
+        if self._title is not None:
+            self._title.set_text(f"VirtualLife Simulation - Step {runner.current_step}")
         
         # Collect entity positions by type
         positions: Dict[str, List[Tuple[float, float]]] = {
@@ -116,7 +127,7 @@ class MatplotlibVisualizer(Visualizer):
                 x, y = pos
                 entity = env.entities[next(iter(entity_ids))]
                 entity_type = None
-                for component_type in ["plant", "herbivore", "predator"]:
+                for component_type in self._category_priority:
                     if entity.has_component(component_type):
                         entity_type = component_type
                         break
@@ -126,21 +137,22 @@ class MatplotlibVisualizer(Visualizer):
         # Update scatter plots
         for entity_type, pos_list in positions.items():
             if pos_list:
-                x, y = zip(*pos_list)
+                offsets = np.asarray(pos_list, dtype=float)
             else:
-                x, y = [], []
-            self.scatter_plots[entity_type].set_offsets(np.c_[x, y])
+                offsets = np.empty((0, 2))
+            self.scatter_plots[entity_type].set_offsets(offsets)
         
         # Update resource plot if available
         if self.resource_plot is not None and "food" in env.resources:
-            # Convert resources to numpy array
-            resource_array = np.zeros((env.height, env.width))
+            # Rasterize the sparse resource dict into the reused buffer
+            resource_array = self._resource_buffer
+            resource_array.fill(0.0)
             for (x, y), value in env.resources["food"].items():
                 resource_array[y, x] = value
             self.resource_plot.set_array(resource_array)
         
-        # Redraw
-        self.fig.canvas.draw()
+        # Schedule a coalesced redraw rather than forcing a synchronous one
+        self.fig.canvas.draw_idle()
         self.fig.canvas.flush_events()
     
     def cleanup(self) -> None: